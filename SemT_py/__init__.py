@@ -1,11 +1,17 @@
-from .data_handler import DataHandler
-from .token_manager import TokenManager
-from .extension_manager import ExtensionManager
-from .reconciliation_manager import ReconciliationManager
-from .utils import Utility
-from .dataset_manager import DatasetManager
-from .semtui_evals import EvaluationManager
-from .modification_manager import ModificationManager
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so e.g. importing
+# TokenManager does not pull in pandas or the other managers
+_EXPORTS = {
+    "DataHandler": ".data_handler",
+    "TokenManager": ".token_manager",
+    "ExtensionManager": ".extension_manager",
+    "ReconciliationManager": ".reconciliation_manager",
+    "Utility": ".utils",
+    "DatasetManager": ".dataset_manager",
+    "EvaluationManager": ".semtui_evals",
+    "ModificationManager": ".modification_manager",
+}
 
 __all__ = [
     "DataHandler",
@@ -18,3 +24,15 @@ __all__ = [
     "ModificationManager"
 ]
 
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
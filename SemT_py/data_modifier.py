@@ -1,5 +1,13 @@
+import numpy as np
 import pandas as pd
 
+def _iso_date_strings(dates):
+    # np.datetime_as_string formats in C; strftime is a per-element Python call.
+    # It is only exact for tz-naive values without NaT (strftime keeps NaT as NaN).
+    if dates.dt.tz is None and not dates.isna().any():
+        return pd.Series(np.datetime_as_string(dates.to_numpy(), unit='D'), index=dates.index)
+    return dates.dt.strftime('%Y-%m-%d')
+
 class DataModifier:
     @staticmethod
     def iso_date(df, date_col):
@@ -9,12 +17,12 @@ class DataModifier:
         
         # Check if the column is already in datetime format
         if pd.api.types.is_datetime64_any_dtype(df[date_col]):
-            df[date_col] = df[date_col].dt.strftime('%Y-%m-%d')
+            df[date_col] = _iso_date_strings(df[date_col])
             return df
         
         # Attempt to parse the column as dates
         try:
-            df[date_col] = pd.to_datetime(df[date_col], format='%Y%m%d', errors='coerce')
+            df[date_col] = pd.to_datetime(df[date_col], format='%Y%m%d', errors='coerce', cache=True)
         except Exception as e:
             raise ValueError(f"Error parsing column '{date_col}' as dates: {e}")
         
@@ -23,7 +31,7 @@ class DataModifier:
             raise ValueError(f"Column '{date_col}' contains invalid date values that could not be converted.")
         
         # Convert to ISO format
-        df[date_col] = df[date_col].dt.strftime('%Y-%m-%d')
+        df[date_col] = _iso_date_strings(df[date_col])
         return df
 
     @staticmethod
@@ -56,16 +64,24 @@ class DataModifier:
 
     @staticmethod
     def convert_dtypes(df, dtype_dict):
-        for col, dtype in dtype_dict.items():
-            # Check if the column exists in the DataFrame
+        # Check that every column exists in the DataFrame
+        for col in dtype_dict:
             if col not in df.columns:
                 raise ValueError(f"Column '{col}' does not exist in the DataFrame.")
-            
+
+        # Convert all columns in a single astype call instead of one Series at a time
+        try:
+            return df.astype(dtype_dict)
+        except Exception:
+            pass
+
+        # Find the offending column so the error names it
+        for col, dtype in dtype_dict.items():
             try:
-                df[col] = df[col].astype(dtype)
+                df[col].astype(dtype)
             except Exception as e:
                 raise ValueError(f"Error converting column '{col}' to type '{dtype}': {e}")
-        return df
+        raise ValueError(f"Error converting columns to types {dtype_dict}.")
 
     @staticmethod
     def reorder_columns(df, new_column_order):
@@ -1,14 +1,20 @@
 import requests
-import json
+import orjson
+import ijson
 import pandas as pd
 import os
+import time
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 from fake_useragent import UserAgent
+from requests_toolbelt import MultipartEncoder
 from .utils import Utility 
-from .token_manager import TokenManager
+from .token_manager import TokenManager, BearerAuth
 from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any
 import logging
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, JSONDecodeError
+from urllib3.util.retry import Retry
 
 # Configure logging
 #logging.basicConfig(level=logging.INFO)
@@ -19,48 +25,106 @@ if TYPE_CHECKING:
 
 
 class DatasetManager:
+    # Seconds the dataset list and a dataset's table listing are trusted before they are re-fetched
+    TABLES_CACHE_TTL = 30
+    # Tables up to this in-memory size are uploaded from a BytesIO buffer rather than a temp file
+    IN_MEMORY_UPLOAD_BYTES = 64 * 1024 * 1024
+
     def __init__(self, base_url, token_manager):
         self.base_url = base_url.rstrip('/') + '/'
         self.api_url = urljoin(self.base_url, 'api/')
+        # Endpoint URLs are resolved once; request paths only fill in the ids
+        self._datasets_url = urljoin(self.api_url, 'dataset')
+        self._dataset_url_tpl = f"{self.api_url}dataset/{{}}"
+        self._tables_url_tpl = f"{self.api_url}dataset/{{}}/table"
+        self._table_url_tpl = f"{self.api_url}dataset/{{}}/table/{{}}"
         self.token_manager = token_manager
         self.user_agent = UserAgent()
         self.logger = logging.getLogger(__name__)
-
-    def _get_headers(self):
-        token = self.token_manager.get_token()
-        return {
+        # Reused across calls so connections stay alive between requests; idempotent calls
+        # (listing, fetching, deleting) are retried on transient gateway errors
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Every header except Authorization is fixed for the manager's lifetime, so it lives on
+        # the session; a single User-Agent is sampled once instead of per request
+        self._session.headers.update({
             'Accept': 'application/json, text/plain, */*',
-            'Authorization': f'Bearer {token}',
-            'User-Agent': self.user_agent.random,
             'Origin': self.base_url.rstrip('/'),
-            'Referer': self.base_url
-        }
+            'Referer': self.base_url,
+            'User-Agent': self.user_agent.random,
+        })
+        # Resolve the bearer token per request so refreshed tokens are picked up
+        self._session.auth = BearerAuth(token_manager)
+        # dataset_id -> (fetched_at, tables, {table name: table id}), filled by get_dataset_tables
+        self._tables_cache: Dict[str, Tuple[float, list, Dict[str, str]]] = {}
+        # (fetched_at, collection) of the last dataset listing, filled by get_database_list
+        self._datasets_cache: Optional[Tuple[float, list]] = None
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'DatasetManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
-    def get_database_list(self, debug: bool = False) -> pd.DataFrame:
+    def _is_fresh(self, cached) -> bool:
+        return cached is not None and time.monotonic() - cached[0] <= self.TABLES_CACHE_TTL
+
+    def get_cache_info(self, dataset_id: Optional[str] = None) -> Optional[Dict[str, float]]:
+        """
+        Reports how fresh a cached listing is.
+
+        Args:
+            dataset_id (str, optional): The dataset whose table listing to inspect. If omitted,
+                the cached dataset list is inspected.
+
+        Returns:
+            dict: {'age': seconds since the listing was fetched, 'ttl': seconds it is trusted for},
+                or None if nothing is cached.
+        """
+        cached = self._datasets_cache if dataset_id is None else self._tables_cache.get(dataset_id)
+        if cached is None:
+            return None
+        return {'age': time.monotonic() - cached[0], 'ttl': self.TABLES_CACHE_TTL}
+
+    def get_database_list(self, debug: bool = False, refresh: bool = False) -> pd.DataFrame:
         """
         Retrieves the list of datasets from the server.
+        The listing is cached for TABLES_CACHE_TTL seconds.
 
         Args:
             debug (bool): If True, prints additional information like metadata and status code.
+            refresh (bool): If True, bypasses the cache and always queries the server.
             
         Returns:
             DataFrame: A DataFrame containing the datasets.
         """
-        url = urljoin(self.api_url, 'dataset')
-        headers = self._get_headers()
+        if not (refresh or debug) and self._is_fresh(self._datasets_cache):
+            return pd.DataFrame(self._datasets_cache[1])
+
+        url = self._datasets_url
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if debug:
                 print(f"Status Code: {response.status_code}")
                 print("Metadata:")
-                print(json.dumps(data.get('meta', {}), indent=4))  # Display metadata in a pretty format
+                print(orjson.dumps(data.get('meta', {}), option=orjson.OPT_INDENT_2).decode())  # Display metadata in a pretty format
                 
             if 'collection' in data:
+                self._datasets_cache = (time.monotonic(), data['collection'])
                 # Convert the 'collection' key into a DataFrame
                 return pd.DataFrame(data['collection'])
             else:
@@ -88,14 +152,16 @@ class DatasetManager:
         Returns:
             str: A message indicating the result of the operation.
         """
-        url = f"{self.api_url}dataset/{dataset_id}"
-        headers = self._get_headers()
-
+        url = self._dataset_url_tpl.format(dataset_id)
         try:
-            response = requests.delete(url, headers=headers)
+            response = self._session.delete(url)
             response.raise_for_status()
+            self._invalidate_tables_cache(dataset_id)
             return f"Dataset with ID {dataset_id} deleted successfully!"
         except requests.RequestException as e:
+            # Connection errors and timeouts carry no response
+            if e.response is None:
+                return f"Request failed: {e}"
             if e.response.status_code == 401:
                 return "Unauthorized: Invalid or missing token."
             elif e.response.status_code == 404:
@@ -103,45 +169,72 @@ class DatasetManager:
             else:
                 return f"Failed to delete dataset: {e.response.status_code}, {e.response.text}"
 
-    def delete_datasets(self, dataset_ids):
+    def delete_datasets(self, dataset_ids, max_workers: int = 8):
         """
         Deletes multiple datasets by their IDs from the server using the specified API endpoint.
+        The DELETE requests are sent concurrently over the shared session.
         
         Args:
             dataset_ids (list): A list of dataset IDs to delete.
+            max_workers (int): Maximum number of concurrent requests.
 
         Returns:
-            list: A list of messages indicating the result of each deletion operation.
+            list: A list of messages indicating the result of each deletion operation, in input order.
         """
-        results = []
-
-        for dataset_id in dataset_ids:
-            result = self.delete_dataset(dataset_id)
-            results.append(result)
-        
-        return results
+        if not dataset_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.delete_dataset, dataset_ids))
     
-    def get_dataset_tables(self, dataset_id):
+    def get_dataset_tables(self, dataset_id, refresh: bool = False):
         """
         Retrieves the list of tables for a given dataset.
+        The listing is cached per dataset for TABLES_CACHE_TTL seconds.
 
         Args:
             dataset_id (str): The ID of the dataset.
+            refresh (bool): If True, bypasses the cache and always queries the server.
 
         Returns:
             list: A list of tables in the dataset.
         """
-        url = f"{self.api_url}dataset/{dataset_id}/table"
-        headers = self._get_headers()
+        cached = self._tables_cache.get(dataset_id)
+        if not refresh and self._is_fresh(cached):
+            return list(cached[1])
 
+        url = self._tables_url_tpl.format(dataset_id)
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url)
             response.raise_for_status()
-            return response.json()["collection"]
-        except (requests.RequestException, json.JSONDecodeError, KeyError) as e:
+            tables = orjson.loads(response.content)["collection"]
+        except (requests.RequestException, orjson.JSONDecodeError, KeyError) as e:
             print(f"Error getting dataset tables: {e}")
+            # An expired listing that could not be refreshed must not keep resolving names
+            self._tables_cache.pop(dataset_id, None)
             return []
 
+        # Index names to ids (first match wins) so name lookups can skip the listing for a while
+        index = {}
+        for table in tables:
+            if "name" in table and "id" in table:
+                index.setdefault(table["name"], table["id"])
+        self._tables_cache[dataset_id] = (time.monotonic(), tables, index)
+        return list(tables)
+
+    def _get_table_id(self, dataset_id, table_name):
+        """
+        Resolves a table name to its ID, listing the dataset's tables only if the cached index is stale.
+        """
+        self.get_dataset_tables(dataset_id)
+        cached = self._tables_cache.get(dataset_id)
+        # Never fall back to an expired index: the table may have been deleted or renamed since
+        return cached[2].get(table_name) if self._is_fresh(cached) else None
+
+    def _invalidate_tables_cache(self, dataset_id):
+        # The dataset list carries per-dataset table counts, so it goes stale along with the tables
+        self._tables_cache.pop(dataset_id, None)
+        self._datasets_cache = None
+
     def get_table(self, dataset_id, table_id):
         """
         Retrieves a table by its ID from a specific dataset.
@@ -153,17 +246,54 @@ class DatasetManager:
         Returns:
             dict: The table data in JSON format.
         """
-        url = f"{self.api_url}dataset/{dataset_id}/table/{table_id}"
-        headers = self._get_headers()
-
+        url = self._table_url_tpl.format(dataset_id, table_id)
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error occurred while retrieving the table data: {e}")
             return None
 
+    def iter_table(self, dataset_id, table_id):
+        """
+        Streams the rows of a table from a specific dataset, yielding one row at a time.
+
+        The response is parsed incrementally with ijson as it arrives, so memory use stays
+        bounded by a single row instead of the whole table.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            table_id (str): The ID of the table to stream.
+
+        Yields:
+            tuple: (row_id, row) pairs in the order the server sends them.
+        """
+        url = self._table_url_tpl.format(dataset_id, table_id)
+
+        with self._session.get(url, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip transfer encoding before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.kvitems(response.raw, 'rows', use_float=True)
+
+    def get_tables_bulk(self, dataset_id, table_ids, max_workers: int = 8):
+        """
+        Retrieves several tables from a specific dataset, sending the requests concurrently.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            table_ids (list): The IDs of the tables to retrieve.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list: The table data for each ID in input order, with None for tables that could not be retrieved.
+        """
+        if not table_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda table_id: self.get_table(dataset_id, table_id), table_ids))
+
     def get_table_by_name(self, dataset_id, table_name):
         """
         Retrieves a table by its name from a specific dataset.
@@ -175,18 +305,47 @@ class DatasetManager:
         Returns:
             dict: The table data in JSON format, including the table_id.
         """
-        tables = self.get_dataset_tables(dataset_id)
+        table_id = self._get_table_id(dataset_id, table_name)
 
-        for table in tables:
-            if table["name"] == table_name:
-                table_id = table["id"]
+        if table_id is not None:
+            table_data = self.get_table(dataset_id, table_id)
+            if table_data:
+                table_data["id"] = table_id
+                return table_data
+
+        print(f"Table '{table_name}' not found in the dataset.")
+        return None
+
+    def get_tables_by_names(self, dataset_id, table_names, max_workers: int = 8):
+        """
+        Retrieves several tables by name from a specific dataset. The names are resolved
+        from a single listing and the tables are then fetched concurrently.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            table_names (list): The names of the tables to retrieve.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            list: The table data (including the table_id) for each name in input order,
+                with None for tables that could not be found or retrieved.
+        """
+        if not table_names:
+            return []
+        table_ids = [self._get_table_id(dataset_id, table_name) for table_name in table_names]
+
+        def fetch(item):
+            table_name, table_id = item
+            if table_id is not None:
                 table_data = self.get_table(dataset_id, table_id)
                 if table_data:
                     table_data["id"] = table_id
                     return table_data
+            print(f"Table '{table_name}' not found in the dataset.")
+            return None
 
-        print(f"Table '{table_name}' not found in the dataset.")
-        return None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, zip(table_names, table_ids)))
 
     def get_table_by_id(self, dataset_id, table_id):
         """
@@ -244,21 +403,35 @@ class DatasetManager:
                 - message (str): A descriptive message about the operation.
                 - response_data (dict): The full response data from the API.
         """
-        url = f"{self.api_url}dataset/{dataset_id}/table/"
-        headers = self._get_headers()
-        headers.pop('Content-Type', None)  # Remove Content-Type for file upload
-        
-        temp_file_path = Utility.create_temp_csv(table_data)
+        url = self._tables_url_tpl.format(dataset_id) + '/'
+
+        temp_file_path = None
         
         try:
-            with open(temp_file_path, 'rb') as file:
-                files = {'file': (file.name, file, 'text/csv')}
-                data = {'name': table_name}
+            # Tables that comfortably fit in memory are serialised straight into a buffer;
+            # larger ones go through a temporary file so the CSV is never held in RAM whole.
+            # deep=True counts the string contents of object columns, not just their 8-byte pointers
+            if table_data.memory_usage(index=False, deep=True).sum() <= self.IN_MEMORY_UPLOAD_BYTES:
+                upload = Utility.create_csv_buffer(table_data)
+                file_name = f"{table_name}.csv"
+            else:
+                temp_file_path = Utility.create_temp_csv(table_data)
+                upload = open(temp_file_path, 'rb')
+                file_name = os.path.basename(temp_file_path)
+
+            with upload:
+                # Stream the multipart body from the upload source instead of building it in memory
+                encoder = MultipartEncoder(fields={
+                    'name': table_name,
+                    'file': (file_name, upload, 'text/csv')
+                })
+                headers = {'Content-Type': encoder.content_type}
                 
-                response = requests.post(url, headers=headers, data=data, files=files, timeout=30)
+                response = self._session.post(url, headers=headers, data=encoder, timeout=30)
             
             response.raise_for_status()
-            response_data = response.json()
+            self._invalidate_tables_cache(dataset_id)
+            response_data = orjson.loads(response.content)
             
             # Process the result
             result = self._process_add_table_result(response_data)
@@ -272,7 +445,7 @@ class DatasetManager:
         
         except requests.RequestException as e:
             error_message = f"Request error occurred: {str(e)}"
-            if hasattr(e, 'response'):
+            if e.response is not None:
                 error_message += f"\nResponse status code: {e.response.status_code}"
                 error_message += f"\nResponse content: {e.response.text[:200]}..."
             self.logger.error(error_message)
@@ -289,9 +462,38 @@ class DatasetManager:
             return error_message, None
         
         finally:
-            if os.path.exists(temp_file_path):
+            if temp_file_path and os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
 
+    def add_tables_to_dataset(self, dataset_id: str, tables: List[Tuple[pd.DataFrame, str]], max_workers: int = 8) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Adds several tables to a specific dataset, uploading them concurrently over the shared session.
+
+        Args:
+            dataset_id (str): The ID of the dataset.
+            tables (list): (table_data, table_name) pairs to add.
+            max_workers (int): Maximum number of uploads in flight at once.
+
+        Returns:
+            list: A (table_name, message, table_id) tuple per table in input order;
+                table_id is None if the upload failed.
+        """
+        if not tables:
+            return []
+
+        def add(item):
+            table_data, table_name = item
+            try:
+                message, response_data = self.add_table_to_dataset(dataset_id, table_data, table_name)
+            except Exception as e:
+                # One failed upload must not abort the batch and lose the IDs of tables already created
+                return table_name, f"An unexpected error occurred: {str(e)}", None
+            table_id = self.extract_table_id(response_data) if isinstance(response_data, dict) else None
+            return table_name, message, table_id
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(add, tables))
+
     def extract_table_id(self, result: Dict[str, Any]) -> str:
         """
         Extracts the table ID from the result of add_table_to_dataset.
@@ -336,52 +538,98 @@ class DatasetManager:
             dataset_id (str): The ID of the dataset.
             table_name (str): The name of the table to delete.
         """
-        table = self.get_table_by_name(dataset_id, table_name)
-        if not table:
-            return
-        
-        table_id = table.get("id")
+        # Only the ID is needed, so resolve it from the name index instead of fetching the table
+        table_id = self._get_table_id(dataset_id, table_name)
         if not table_id:
-            print(f"Failed to retrieve the ID for table '{table_name}'.")
+            print(f"Table '{table_name}' not found in the dataset.")
             return
         
-        url = f"{self.api_url}dataset/{dataset_id}/table/{table_id}"
-        headers = self._get_headers()
+        if self._delete_table_request(dataset_id, table_id, table_name):
+            self._invalidate_tables_cache(dataset_id)
+
+    def _delete_table_request(self, dataset_id, table_id, table_name):
+        """
+        Sends the DELETE for one table and reports the outcome. Returns True if the table was deleted.
+        """
+        url = self._table_url_tpl.format(dataset_id, table_id)
         
         try:
-            response = requests.delete(url, headers=headers)
+            response = self._session.delete(url)
             response.raise_for_status()
             print(f"Table '{table_name}' deleted successfully!")
+            return True
         except requests.RequestException as e:
-            if e.response.status_code == 401:
+            # Connection errors and timeouts carry no response
+            if e.response is None:
+                print(f"Request failed for table '{table_name}': {e}")
+            elif e.response.status_code == 401:
                 print("Unauthorized: Invalid or missing token.")
             elif e.response.status_code == 404:
                 print(f"Table '{table_name}' not found in the dataset.")
             else:
                 print(f"Failed to delete table: {e.response.status_code}, {e.response.text}")
+            return False
+
+    def delete_tables(self, dataset_id, table_names, max_workers: int = 8):
+        """
+        Deletes multiple tables by their names from a specific dataset, sending the requests concurrently.
 
-    def delete_tables_by_id(self, dataset_id, table_ids):
+        Args:
+            dataset_id (str): The ID of the dataset.
+            table_names (list): A list of table names to delete.
+            max_workers (int): Maximum number of concurrent requests.
+        """
+        # Resolve every name from one listing before any delete invalidates the index
+        to_delete = []
+        for table_name in table_names:
+            table_id = self._get_table_id(dataset_id, table_name)
+            if table_id:
+                to_delete.append((table_id, table_name))
+            else:
+                print(f"Table '{table_name}' not found in the dataset.")
+
+        if not to_delete:
+            return
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda item: self._delete_table_request(dataset_id, *item), to_delete))
+        finally:
+            # Some deletes may have gone through even if the batch was interrupted
+            self._invalidate_tables_cache(dataset_id)
+
+    def delete_tables_by_id(self, dataset_id, table_ids, max_workers: int = 8):
         """
         Deletes multiple tables by their IDs from a specific dataset.
+        The DELETE requests are sent concurrently over the shared session.
         
         Args:
             dataset_id (str): The ID of the dataset.
             table_ids (list): A list of table IDs to delete.
+            max_workers (int): Maximum number of concurrent requests.
         """
-        headers = self._get_headers()
+        if not table_ids:
+            return
 
-        for table_id in table_ids:
-            url = f"{self.api_url}dataset/{dataset_id}/table/{table_id}"
+        def delete(table_id):
+            url = self._table_url_tpl.format(dataset_id, table_id)
             
             try:
-                response = requests.delete(url, headers=headers)
+                response = self._session.delete(url)
                 response.raise_for_status()
                 print(f"Table with ID '{table_id}' deleted successfully!")
             except requests.RequestException as e:
-                if e.response.status_code == 401:
+                # Connection errors and timeouts carry no response
+                if e.response is None:
+                    print(f"Request failed for table ID '{table_id}': {e}")
+                elif e.response.status_code == 401:
                     print(f"Unauthorized: Invalid or missing token for table ID '{table_id}'.")
                 elif e.response.status_code == 404:
                     print(f"Table with ID '{table_id}' not found in the dataset.")
                 else:
                     print(f"Failed to delete table with ID '{table_id}': {e.response.status_code}, {e.response.text}")
-  
\ No newline at end of file
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(delete, table_ids))
+        # Invalidate only once every delete has finished, so a listing fetched meanwhile is not kept
+        self._invalidate_tables_cache(dataset_id)
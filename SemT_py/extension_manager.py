@@ -1,13 +1,19 @@
 import requests
-import json
-import copy
+import orjson
+import gzip
 import pandas as pd
 from urllib.parse import urljoin
-from copy import deepcopy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from IPython.display import display, HTML
 from .token_manager import TokenManager
 
 class ExtensionManager:
+    # Request bodies larger than this many bytes are gzip-compressed before sending
+    GZIP_MIN_BYTES = 4096
+    # (connect, read) timeout in seconds; extender services may take long to answer, so reads are unbounded
+    TIMEOUT = (10, None)
+
     def __init__(self, base_url, token):
         self.base_url = base_url.rstrip('/') + '/'
         self.api_url = urljoin(self.base_url, 'api/extenders')
@@ -18,20 +24,46 @@ class ExtensionManager:
             'Accept': 'application/json'
         }
 
+        # A pooled session keeps connections alive across extender calls; idempotent
+        # calls are retried on transient gateway errors
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # extender id -> extender, filled from the first successful listing
+        self._extenders_by_id = None
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def create_backend_payload(self, reconciled_json):
-        nCellsReconciliated = sum(
-            1 for row in reconciled_json['rows'].values()
-            for cell in row['cells'].values()
-            if cell.get('annotationMeta', {}).get('annotated', False)
-        )
-        all_scores = [
-            cell.get('annotationMeta', {}).get('lowestScore', float('inf'))
-            for row in reconciled_json['rows'].values()
-            for cell in row['cells'].values()
-            if cell.get('annotationMeta', {}).get('annotated', False)
-        ]
-        minMetaScore = min(all_scores) if all_scores else 0
-        maxMetaScore = max(all_scores) if all_scores else 1
+        # Count annotated cells and track their score range in one pass, without a score list
+        inf = float('inf')
+        nCellsReconciliated = 0
+        lowest = inf
+        highest = -inf
+        for row in reconciled_json['rows'].values():
+            for cell in row['cells'].values():
+                annotation_meta = cell.get('annotationMeta')
+                if annotation_meta and annotation_meta.get('annotated', False):
+                    nCellsReconciliated += 1
+                    score = annotation_meta.get('lowestScore', inf)
+                    if score < lowest:
+                        lowest = score
+                    if score > highest:
+                        highest = score
+        minMetaScore = lowest if nCellsReconciliated else 0
+        maxMetaScore = highest if nCellsReconciliated else 1
         payload = {
             "tableInstance": {
                 "id": reconciled_json['table']['id'],
@@ -57,8 +89,18 @@ class ExtensionManager:
         return payload
 
     def prepare_input_data_meteo(self, table, reconciliated_column_name, id_extender, properties, date_column_name, decimal_format):
-        dates = {row_id: [row['cells'][date_column_name]['label'], [], date_column_name] for row_id, row in table['rows'].items()} if date_column_name else {}
-        items = {reconciliated_column_name: {row_id: row['cells'][reconciliated_column_name]['metadata'][0]['id'] for row_id, row in table['rows'].items()}}
+        # One pass over the rows collects both the dates and the entity ids
+        dates = {}
+        ids = {}
+        if date_column_name:
+            for row_id, row in table['rows'].items():
+                cells = row['cells']
+                dates[row_id] = [cells[date_column_name]['label'], [], date_column_name]
+                ids[row_id] = cells[reconciliated_column_name]['metadata'][0]['id']
+        else:
+            for row_id, row in table['rows'].items():
+                ids[row_id] = row['cells'][reconciliated_column_name]['metadata'][0]['id']
+        items = {reconciliated_column_name: ids}
         weather_params = properties if date_column_name else []
         decimal_format = [decimal_format] if decimal_format else []
 
@@ -72,20 +114,16 @@ class ExtensionManager:
         return payload
 
     def prepare_input_data_reconciledColumnExt(self, table, reconciliated_column_name, properties, id_extender):
-        column_data = {
-            row_id: [
-                row['cells'][reconciliated_column_name]['label'],
-                row['cells'][reconciliated_column_name].get('metadata', []),
-                reconciliated_column_name
-            ] for row_id, row in table['rows'].items()
-        }
-        items = {
-            reconciliated_column_name: {
-                row_id: row['cells'][reconciliated_column_name]['metadata'][0]['id']
-                for row_id, row in table['rows'].items()
-                if 'metadata' in row['cells'][reconciliated_column_name] and row['cells'][reconciliated_column_name]['metadata']
-            }
-        }
+        # One pass over the rows collects both the column cells and the entity ids
+        column_data = {}
+        ids = {}
+        for row_id, row in table['rows'].items():
+            cell = row['cells'][reconciliated_column_name]
+            metadata = cell.get('metadata', [])
+            column_data[row_id] = [cell['label'], metadata, reconciliated_column_name]
+            if metadata:
+                ids[row_id] = metadata[0]['id']
+        items = {reconciliated_column_name: ids}
 
         payload = {
             "serviceId": id_extender,
@@ -96,20 +134,16 @@ class ExtensionManager:
         return payload
 
     def prepare_input_data_reconciled(self, table, reconciliated_column_name, properties, id_extender):
-        column_data = {
-            row_id: [
-                row['cells'][reconciliated_column_name]['label'],
-                row['cells'][reconciliated_column_name].get('metadata', []),
-                reconciliated_column_name
-            ] for row_id, row in table['rows'].items()
-        }
-        items = {
-            reconciliated_column_name: {
-                row_id: row['cells'][reconciliated_column_name]['metadata'][0]['id']
-                for row_id, row in table['rows'].items()
-                if 'metadata' in row['cells'][reconciliated_column_name] and row['cells'][reconciliated_column_name]['metadata']
-            }
-        }
+        # One pass over the rows collects both the column cells and the entity ids
+        column_data = {}
+        ids = {}
+        for row_id, row in table['rows'].items():
+            cell = row['cells'][reconciliated_column_name]
+            metadata = cell.get('metadata', [])
+            column_data[row_id] = [cell['label'], metadata, reconciliated_column_name]
+            if metadata:
+                ids[row_id] = metadata[0]['id']
+        items = {reconciliated_column_name: ids}
 
         payload = {
             "serviceId": id_extender,
@@ -123,14 +157,21 @@ class ExtensionManager:
         try:
             if debug:
                 print("Sending payload to extender service:")
-                print(json.dumps(payload, indent=2))
-            response = requests.post(self.api_url, headers=self.headers, json=payload)
+                print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+            # self.headers is read on every call so later changes to it take effect
+            body = orjson.dumps(payload)
+            headers = self.headers
+            if len(body) > self.GZIP_MIN_BYTES:
+                # Whole-column extender inputs are highly repetitive; level 1 keeps compression cheap
+                body = gzip.compress(body, compresslevel=1)
+                headers = {**headers, 'Content-Encoding': 'gzip'}
+            response = self._session.post(self.api_url, data=body, headers=headers, timeout=self.TIMEOUT)
             response.raise_for_status()
             if debug:
                 print("Received response from extender service:")
                 print(f"Status Code: {response.status_code}")
                 print(f"Response Content: {response.text}")
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.HTTPError as http_err:
             if debug:
                 print(f"HTTP error occurred: {http_err}")
@@ -143,8 +184,11 @@ class ExtensionManager:
             raise
 
     def compose_extension_table(self, table, extension_response):
+        # The table is extended in place; the new cells are added to the existing row dicts
+        columns = table['columns']
+        rows = table['rows']
         for column_name, column_data in extension_response['columns'].items():
-            table['columns'][column_name] = {
+            columns[column_name] = {
                 'id': column_name,
                 'label': column_data['label'],
                 'status': 'extended',
@@ -154,7 +198,7 @@ class ExtensionManager:
                 'annotationMeta': {}
             }
             for row_id, cell_data in column_data['cells'].items():
-                table['rows'][row_id]['cells'][column_name] = {
+                rows[row_id]['cells'][column_name] = {
                     'id': f"{row_id}${column_name}",
                     'label': cell_data['label'],
                     'metadata': cell_data['metadata']
@@ -179,8 +223,8 @@ class ExtensionManager:
         extended_table = self.compose_extension_table(table, extension_response)
         backend_payload = self.create_backend_payload(extended_table)
         if debug:
-            print("Extended table:", json.dumps(extended_table, indent=2))
-            print("Backend payload:", json.dumps(backend_payload, indent=2))
+            print("Extended table:", orjson.dumps(extended_table, option=orjson.OPT_INDENT_2).decode())
+            print("Backend payload:", orjson.dumps(backend_payload, option=orjson.OPT_INDENT_2).decode())
         else:
             print("Column extended successfully!")
         return extended_table, backend_payload
@@ -222,7 +266,7 @@ class ExtensionManager:
         try:
             # Correctly construct the URL
             url = urljoin(self.api_url, 'extenders/list')
-            response = requests.get(url, headers=self.headers)
+            response = self._session.get(url, headers=self.headers, timeout=self.TIMEOUT)
             response.raise_for_status()
             
             # Debugging output
@@ -240,7 +284,7 @@ class ExtensionManager:
                     print(response.text)
                 return None
 
-            return response.json()
+            return orjson.loads(response.content)
         except requests.RequestException as e:
             if debug:
                 print(f"Error occurred while retrieving extender data: {e}")
@@ -248,7 +292,7 @@ class ExtensionManager:
                     print(f"Response status code: {e.response.status_code}")
                     print(f"Response content: {e.response.text[:500]}...")  # Show first 500 characters of error content
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             if debug:
                 print(f"JSON decoding error: {e}")
                 print(f"Raw response content: {response.text}")
@@ -261,16 +305,13 @@ class ExtensionManager:
         :param service_list: Data regarding available services.
         :return: DataFrame containing extenders' information.
         """
-        # Initialize a DataFrame with the specified columns
-        reconciliators = pd.DataFrame(columns=["id", "relativeUrl", "name"])
-        
-        # Populate the DataFrame with the extenders' information
-        for reconciliator in service_list:
-            reconciliators.loc[len(reconciliators)] = [
-                reconciliator["id"], reconciliator.get("relativeUrl", ""), reconciliator["name"]
-            ]
+        # Collect the rows first and build the DataFrame once, rather than growing it row by row
+        reconciliators = [
+            (reconciliator["id"], reconciliator.get("relativeUrl", ""), reconciliator["name"])
+            for reconciliator in service_list
+        ]
         
-        return reconciliators
+        return pd.DataFrame(reconciliators, columns=["id", "relativeUrl", "name"])
     
     def get_extenders_list(self, debug=False):
         """
@@ -291,6 +332,21 @@ class ExtensionManager:
                 print("Failed to retrieve extenders data.")
             return None
     
+    def _get_extender_index(self):
+        """
+        Returns the extenders keyed by ID, listing them from the backend only on first use.
+        """
+        if self._extenders_by_id is None:
+            extender_data = self.get_extender_data()
+            if not extender_data:
+                return None
+            # First match wins, as with the linear search this replaces
+            index = {}
+            for extender in extender_data:
+                index.setdefault(extender['id'], extender)
+            self._extenders_by_id = index
+        return self._extenders_by_id
+
     def get_extender_parameters(self, extender_id, print_params=False):
         """
         Retrieves the parameters needed for a specific extender service.
@@ -299,62 +355,62 @@ class ExtensionManager:
         :param print_params: (optional) Whether to print the retrieved parameters or not.
         :return: A dictionary containing the parameter details, or None if the extender is not found.
         """
-        extender_data = self.get_extender_data()
-        if not extender_data:
+        extenders = self._get_extender_index()
+        if not extenders:
             return None
         
-        for extender in extender_data:
-            if extender['id'] == extender_id:
-                parameters = extender.get('formParams', [])
-                mandatory_params = [
-                    {
-                        'name': param['id'],
-                        'type': param['inputType'],
-                        'mandatory': 'required' in param.get('rules', []),
-                        'description': param.get('description', ''),
-                        'label': param.get('label', ''),
-                        'infoText': param.get('infoText', ''),
-                        'options': param.get('options', [])
-                    } for param in parameters if 'required' in param.get('rules', [])
-                ]
-                optional_params = [
-                    {
-                        'name': param['id'],
-                        'type': param['inputType'],
-                        'mandatory': 'required' in param.get('rules', []),
-                        'description': param.get('description', ''),
-                        'label': param.get('label', ''),
-                        'infoText': param.get('infoText', ''),
-                        'options': param.get('options', [])
-                    } for param in parameters if 'required' not in param.get('rules', [])
-                ]
-
-                param_dict = {
-                    'mandatory': mandatory_params,
-                    'optional': optional_params
-                }
+        extender = extenders.get(extender_id)
+        if extender is not None:
+            parameters = extender.get('formParams', [])
+            mandatory_params = [
+                {
+                    'name': param['id'],
+                    'type': param['inputType'],
+                    'mandatory': 'required' in param.get('rules', []),
+                    'description': param.get('description', ''),
+                    'label': param.get('label', ''),
+                    'infoText': param.get('infoText', ''),
+                    'options': param.get('options', [])
+                } for param in parameters if 'required' in param.get('rules', [])
+            ]
+            optional_params = [
+                {
+                    'name': param['id'],
+                    'type': param['inputType'],
+                    'mandatory': 'required' in param.get('rules', []),
+                    'description': param.get('description', ''),
+                    'label': param.get('label', ''),
+                    'infoText': param.get('infoText', ''),
+                    'options': param.get('options', [])
+                } for param in parameters if 'required' not in param.get('rules', [])
+            ]
+
+            param_dict = {
+                'mandatory': mandatory_params,
+                'optional': optional_params
+            }
 
-                if print_params:
-                    print(f"Parameters for extender '{extender_id}':")
-                    print("Mandatory parameters:")
-                    for param in param_dict['mandatory']:
-                        print(f"- {param['name']} ({param['type']}): Mandatory")
-                        print(f"  Description: {param['description']}")
-                        print(f"  Label: {param['label']}")
-                        print(f"  Info Text: {param['infoText']}")
-                        print(f"  Options: {param['options']}")
-                        print("")
-
-                    print("Optional parameters:")
-                    for param in param_dict['optional']:
-                        print(f"- {param['name']} ({param['type']}): Optional")
-                        print(f"  Description: {param['description']}")
-                        print(f"  Label: {param['label']}")
-                        print(f"  Info Text: {param['infoText']}")
-                        print(f"  Options: {param['options']}")
-                        print("")
-
-                return param_dict
+            if print_params:
+                print(f"Parameters for extender '{extender_id}':")
+                print("Mandatory parameters:")
+                for param in param_dict['mandatory']:
+                    print(f"- {param['name']} ({param['type']}): Mandatory")
+                    print(f"  Description: {param['description']}")
+                    print(f"  Label: {param['label']}")
+                    print(f"  Info Text: {param['infoText']}")
+                    print(f"  Options: {param['options']}")
+                    print("")
+
+                print("Optional parameters:")
+                for param in param_dict['optional']:
+                    print(f"- {param['name']} ({param['type']}): Optional")
+                    print(f"  Description: {param['description']}")
+                    print(f"  Label: {param['label']}")
+                    print(f"  Info Text: {param['infoText']}")
+                    print(f"  Options: {param['options']}")
+                    print("")
+
+            return param_dict
 
         print(f"Extender with ID '{extender_id}' not found.")
         return None
@@ -390,45 +446,45 @@ class ExtensionManager:
         Returns:
             dict: A dictionary containing both parameters and options, or None if the extender is not found.
         """
-        extender_data = self.get_extender_data()
+        extenders = self._get_extender_index()
 
-        if not extender_data:
+        if not extenders:
             return None
 
-        # Search for the requested extender by ID
-        for extender in extender_data:
-            if extender['id'] == extender_id:
-                # Retrieve parameter details and segregate into mandatory and optional
-                parameters = extender.get('formParams', [])
-                param_details = {
-                    param['id']: {
-                        'type': param['inputType'],
-                        'mandatory': 'required' in param.get('rules', []),
-                        'description': param.get('description', ''),
-                        'label': param.get('label', ''),
-                        'infoText': param.get('infoText', ''),
-                        'options': param.get('options', [])
-                    } for param in parameters
-                }
+        # Look the requested extender up by ID
+        extender = extenders.get(extender_id)
+        if extender is not None:
+            # Retrieve parameter details and segregate into mandatory and optional
+            parameters = extender.get('formParams', [])
+            param_details = {
+                param['id']: {
+                    'type': param['inputType'],
+                    'mandatory': 'required' in param.get('rules', []),
+                    'description': param.get('description', ''),
+                    'label': param.get('label', ''),
+                    'infoText': param.get('infoText', ''),
+                    'options': param.get('options', [])
+                } for param in parameters
+            }
 
-                # Separate into mandatory and optional for better display
-                mandatory_params = {k: v for k, v in param_details.items() if v['mandatory']}
-                optional_params = {k: v for k, v in param_details.items() if not v['mandatory']}
-
-                # Collect all options for easier access
-                all_options = {param_name: [opt['id'] for opt in details['options']] 
-                            for param_name, details in param_details.items() if details['options']}
-
-                # Format the results neatly for display
-                formatted_result = {
-                    'parameters': {
-                        'mandatory': mandatory_params,
-                        'optional': optional_params
-                    },
-                    'options': all_options
-                }
+            # Separate into mandatory and optional for better display
+            mandatory_params = {k: v for k, v in param_details.items() if v['mandatory']}
+            optional_params = {k: v for k, v in param_details.items() if not v['mandatory']}
+
+            # Collect all options for easier access
+            all_options = {param_name: [opt['id'] for opt in details['options']] 
+                        for param_name, details in param_details.items() if details['options']}
+
+            # Format the results neatly for display
+            formatted_result = {
+                'parameters': {
+                    'mandatory': mandatory_params,
+                    'optional': optional_params
+                },
+                'options': all_options
+            }
 
-                return formatted_result
+            return formatted_result
 
         return None
     
@@ -80,16 +80,24 @@ class ModificationManager:
 
     @staticmethod
     def convert_dtypes(df, dtype_dict):
-        for col, dtype in dtype_dict.items():
-            # Check if the column exists in the DataFrame
+        # Check that every column exists in the DataFrame
+        for col in dtype_dict:
             if col not in df.columns:
                 raise ValueError(f"Column '{col}' does not exist in the DataFrame.")
-            
+
+        # Convert all columns in a single astype call instead of one Series at a time
+        try:
+            return df.astype(dtype_dict)
+        except Exception:
+            pass
+
+        # Find the offending column so the error names it
+        for col, dtype in dtype_dict.items():
             try:
-                df[col] = df[col].astype(dtype)
+                df[col].astype(dtype)
             except Exception as e:
                 raise ValueError(f"Error converting column '{col}' to type '{dtype}': {e}")
-        return df
+        raise ValueError(f"Error converting columns to types {dtype_dict}.")
 
     @staticmethod
     def reorder_columns(df, new_column_order):
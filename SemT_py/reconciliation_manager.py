@@ -1,41 +1,91 @@
 import requests
-import json
-import copy
-import pandas as pd 
+import orjson
 import datetime
+from operator import itemgetter
 from urllib.parse import urljoin
+from typing import TYPE_CHECKING
 from .token_manager import TokenManager
 
+# pandas is only needed to list reconciliators, so it is imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+
+_GEORSS_PREFIX = 'georss:'
+
+# Reconciliators that also take the two optional context columns
+_GEOCODING_RECONCILIATORS = frozenset({'geocodingHere', 'geocodingGeonames'})
+_SUPPORTED_RECONCILIATORS = _GEOCODING_RECONCILIATORS | {'geonames'}
+
+
+def _google_maps_url(id_string):
+    if id_string.startswith(_GEORSS_PREFIX):
+        return f"https://www.google.com/maps/place/{id_string[len(_GEORSS_PREFIX):]}"
+    return ""  # Return empty string if id doesn't contain coordinates
+
+
 class ReconciliationManager:
     def __init__(self, base_url, token_manager):
         self.base_url = base_url.rstrip('/') + '/'
         self.api_url = urljoin(self.base_url, 'api/')
         self.token_manager = token_manager
+        self._cached_token = None
+        self._cached_headers = None
+        # reconciliator id -> reconciliator, filled from the first successful listing
+        self._reconciliators_by_id = None
+        # A shared session keeps connections alive across reconciliation calls
+        self._session = requests.Session()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_headers(self):
-        return {
-            'Authorization': f'Bearer {self.token_manager.get_token()}',
-            'Content-Type': 'application/json;charset=UTF-8',
-            'Accept': 'application/json, text/plain, */*'
-        }
+        # Rebuild the headers only when the token manager hands out a new token
+        token = self.token_manager.get_token()
+        if self._cached_headers is None or token is not self._cached_token:
+            self._cached_token = token
+            self._cached_headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json;charset=UTF-8',
+                'Accept': 'application/json, text/plain, */*'
+            }
+        return self._cached_headers
 
     def prepare_input_data(self, original_input, column_name, reconciliator_id, optional_columns):
+        rows = original_input['rows']
+
+        items = [{"id": column_name, "label": column_name}]
+        items.extend(
+            {"id": f"{row_id}${column_name}", "label": row_data['cells'][column_name]['label']}
+            for row_id, row_data in rows.items()
+        )
+
         input_data = {
             "serviceId": reconciliator_id,
-            "items": [{"id": column_name, "label": column_name}],
+            "items": items,
             "secondPart": {},
             "thirdPart": {}
         }
 
-        for row_id, row_data in original_input['rows'].items():
-            main_column_value = row_data['cells'][column_name]['label']
-            input_data['items'].append({"id": f"{row_id}${column_name}", "label": main_column_value})
-
-            if reconciliator_id in ['geocodingHere', 'geocodingGeonames']:
-                second_part_value = row_data['cells'].get(optional_columns[0], {}).get('label', '')
-                third_part_value = row_data['cells'].get(optional_columns[1], {}).get('label', '')
-                input_data['secondPart'][row_id] = [second_part_value, [], optional_columns[0]]
-                input_data['thirdPart'][row_id] = [third_part_value, [], optional_columns[1]]
+        # The reconciliator does not change per row, so decide once whether the extra parts are needed
+        if reconciliator_id in _GEOCODING_RECONCILIATORS:
+            second_column, third_column = optional_columns[0], optional_columns[1]
+            input_data['secondPart'] = {
+                row_id: [row_data['cells'].get(second_column, {}).get('label', ''), [], second_column]
+                for row_id, row_data in rows.items()
+            }
+            input_data['thirdPart'] = {
+                row_id: [row_data['cells'].get(third_column, {}).get('label', ''), [], third_column]
+                for row_id, row_data in rows.items()
+            }
 
         return input_data
 
@@ -44,152 +94,197 @@ class ReconciliationManager:
         headers = self._get_headers()
         
         try:
-            response = requests.post(url, json=input_data, headers=headers)
+            # Headers already declare a JSON body, so the orjson bytes can be sent as-is
+            response = self._session.post(url, data=orjson.dumps(input_data), headers=headers)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error: {e}")
             return None
 
-    def compose_reconciled_table(self, original_input, reconciliation_output, column_name):
-        final_payload = copy.deepcopy(original_input)
+    def _apply_reconciliation(self, original_input, reconciliation_output, column_name):
+        """
+        Applies a reconciliation response to a table in a single pass over its rows.
 
-        final_payload['table']['lastModifiedDate'] = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        
-        final_payload['columns'][column_name]['status'] = 'reconciliated'
-        final_payload['columns'][column_name]['context'] = {
-            'georss': {
-                'uri': 'http://www.google.com/maps/place/',
-                'total': len(reconciliation_output) - 1,
-                'reconciliated': len(reconciliation_output) - 1
+        Builds the reconciled table directly in its final shape and collects the
+        statistics needed for the backend payload along the way. Only the containers
+        that change are copied; untouched cells are shared with the input table.
+
+        Args:
+            original_input (dict): The table data the reconciliation was requested for.
+            reconciliation_output (iterable): The items returned by the reconciliator service.
+                It is consumed once, so a streaming iterator works as well as a list.
+            column_name (str): The name of the reconciled column.
+
+        Returns:
+            tuple: (final_payload, backend_payload)
+        """
+        def restructure_metadata(item):
+            # Empty-list defaults are only allocated when the key is actually missing
+            item_id = item['id']
+            return {
+                'id': item_id,
+                'name': {
+                    'value': item['name'],
+                    'uri': _google_maps_url(item_id)
+                },
+                'feature': item['feature'] if 'feature' in item else [],
+                'score': item.get('score', 0),
+                'match': item.get('match', True),
+                'type': item['type'] if 'type' in item else []
             }
-        }
-        final_payload['columns'][column_name]['kind'] = 'entity'
-        final_payload['columns'][column_name]['annotationMeta'] = {
-            'annotated': True,
-            'match': {'value': True},
-            'lowestScore': 1,
-            'highestScore': 1
-        }
 
-        column_metadata = next(item for item in reconciliation_output if item['id'] == column_name)
-        final_payload['columns'][column_name]['metadata'] = column_metadata['metadata']
+        # Index the response by row once instead of scanning it per lookup
+        column_metadata = []
+        cell_metadata = {}
+        nItems = 0
+        for item in reconciliation_output:
+            if item['id'] == column_name:
+                column_metadata = item['metadata']
+            else:
+                # Item ids are '<row_id>$<column_name>'; row ids never contain '$'
+                row_id = item['id'].partition('$')[0]
+                cell_metadata[row_id] = item['metadata'][0]
+                nItems += 1
+
+        # Locals are cheaper to reach than globals and attributes inside the row loop
+        inf = float('inf')
+        cell_metadata_get = cell_metadata.get
 
         nCellsReconciliated = 0
-        for item in reconciliation_output:
-            if item['id'] != column_name:
-                row_id, cell_id = item['id'].split('$')
-                cell = final_payload['rows'][row_id]['cells'][cell_id]
-
-                metadata = item['metadata'][0]
-                cell['metadata'] = [metadata]
-
-                cell['annotationMeta'] = {
-                    'annotated': True,
-                    'match': {'value': metadata['match']},
-                    'lowestScore': metadata['score'],
-                    'highestScore': metadata['score']
+        lowestScore = highestScore = None
+        nAnnotated = 0
+        minMetaScore = inf
+        maxMetaScore = -inf
+
+        rows = {}
+        for row_id, row in original_input['rows'].items():
+            cells = dict(row['cells'])
+            metadata = cell_metadata_get(row_id)
+            score = None
+            if metadata is not None:
+                score = metadata.get('score', 0)
+                cells[column_name] = {
+                    **cells[column_name],
+                    'metadata': [restructure_metadata(metadata)],
+                    'annotationMeta': {
+                        'annotated': True,
+                        'match': {'value': True, 'reason': 'reconciliator'},
+                        'lowestScore': score,
+                        'highestScore': score
+                    }
                 }
                 nCellsReconciliated += 1
-
-        final_payload['table']['nCellsReconciliated'] = nCellsReconciliated
-
-        return final_payload
-
-    def restructure_payload(self, payload):
-        def create_google_maps_url(id_string):
-            if id_string.startswith('georss:'):
-                coords = id_string.split('georss:')[-1]
-                return f"https://www.google.com/maps/place/{coords}"
-            return ""  # Return empty string if id doesn't contain coordinates
-
-        reconciliated_columns = [col_key for col_key, col in payload['columns'].items() if col.get('status') == 'reconciliated']
-
-        for column_key in reconciliated_columns:
-            column = payload['columns'][column_key]
-
-            new_metadata = [{
-                'id': 'None:',
-                'match': True,
-                'score': 0,
-                'name': {'value': '', 'uri': ''},
-                'entity': []
-            }]
-
-            for item in column.get('metadata', []):
-                new_entity = {
+            elif column_name in cells:
+                # Cells without a match still get their existing annotations normalised
+                cell = dict(cells[column_name])
+                if 'metadata' in cell:
+                    # Entries whose name is already a {'value', 'uri'} dict are in the final shape
+                    cell['metadata'] = [
+                        item if isinstance(item['name'], dict) else restructure_metadata(item)
+                        for item in cell['metadata']
+                    ]
+                    if cell['metadata']:
+                        score = cell['metadata'][0].get('score', 0)
+                if 'annotationMeta' in cell:
+                    cell['annotationMeta'] = {**cell['annotationMeta'], 'match': {'value': True, 'reason': 'reconciliator'}}
+                    if score is not None:
+                        cell['annotationMeta']['lowestScore'] = score
+                        cell['annotationMeta']['highestScore'] = score
+                cells[column_name] = cell
+
+            if score is not None:
+                if lowestScore is None or score < lowestScore:
+                    lowestScore = score
+                if highestScore is None or score > highestScore:
+                    highestScore = score
+
+            for cell in cells.values():
+                annotation_meta = cell.get('annotationMeta')
+                if annotation_meta and annotation_meta.get('annotated'):
+                    nAnnotated += 1
+                    cell_score = annotation_meta.get('lowestScore', inf)
+                    if cell_score < minMetaScore:
+                        minMetaScore = cell_score
+                    if cell_score > maxMetaScore:
+                        maxMetaScore = cell_score
+
+            rows[row_id] = {**row, 'cells': cells}
+
+        table = dict(original_input['table'])
+        # The 'Z' suffix marks UTC, so take the timestamp in UTC
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        table['lastModifiedDate'] = now.isoformat(timespec='milliseconds') + 'Z'
+        table['nCellsReconciliated'] = nCellsReconciliated
+
+        column = dict(original_input['columns'][column_name])
+        column['status'] = 'reconciliated'
+        column['context'] = {
+            'georss': {
+                'uri': 'http://www.google.com/maps/place/',
+                'total': nItems,
+                'reconciliated': nItems
+            }
+        }
+        column['metadata'] = [{
+            'id': 'None:',
+            'match': True,
+            'score': 0,
+            'name': {'value': '', 'uri': ''},
+            'entity': [
+                {
                     'id': item['id'],
                     'name': {
                         'value': item['name'],
-                        'uri': create_google_maps_url(item['id'])
+                        'uri': _google_maps_url(item['id'])
                     },
                     'score': item.get('score', 0),
                     'match': item.get('match', True),
-                    'type': item.get('type', [])
-                }
-                new_metadata[0]['entity'].append(new_entity)
-
-            column['metadata'] = new_metadata
-
-            scores = []
-            for row in payload['rows'].values():
-                cell = row['cells'].get(column_key)
-                if cell and 'metadata' in cell and len(cell['metadata']) > 0:
-                    score = cell['metadata'][0].get('score', 0)
-                    scores.append(score)
-
-            column['annotationMeta'] = {
-                'annotated': True,
-                'match': {'value': True, 'reason': 'reconciliator'},
-                'lowestScore': min(scores) if scores else 0,
-                'highestScore': max(scores) if scores else 0
-            }
+                    'type': item['type'] if 'type' in item else []
+                } for item in column_metadata
+            ]
+        }]
+        column['annotationMeta'] = {
+            'annotated': True,
+            'match': {'value': True, 'reason': 'reconciliator'},
+            'lowestScore': lowestScore if lowestScore is not None else 0,
+            'highestScore': highestScore if highestScore is not None else 0
+        }
+        column.pop('kind', None)
 
-            if 'kind' in column:
-                del column['kind']
-        
-        for row in payload['rows'].values():
-            for cell_key, cell in row['cells'].items():
-                if cell_key in reconciliated_columns:
-                    if 'metadata' in cell:
-                        for idx, item in enumerate(cell['metadata']):
-                            new_item = {
-                                'id': item['id'],
-                                'name': {
-                                    'value': item['name'],
-                                    'uri': create_google_maps_url(item['id'])
-                                },
-                                'feature': item.get('feature', []),
-                                'score': item.get('score', 0),
-                                'match': item.get('match', True),
-                                'type': item.get('type', [])
-                            }
-                            cell['metadata'][idx] = new_item
-
-                    if 'annotationMeta' in cell:
-                        cell['annotationMeta']['match'] = {'value': True, 'reason': 'reconciliator'}
-                        if 'metadata' in cell and len(cell['metadata']) > 0:
-                            score = cell['metadata'][0].get('score', 0)
-                            cell['annotationMeta']['lowestScore'] = score
-                            cell['annotationMeta']['highestScore'] = score
-
-        return payload
-    
-    def create_backend_payload(self, final_payload):
-        nCellsReconciliated = sum(
-            1 for row in final_payload['rows'].values()
-            for cell in row['cells'].values()
-            if cell.get('annotationMeta', {}).get('annotated', False)
+        columns = dict(original_input['columns'])
+        columns[column_name] = column
+
+        final_payload = {**original_input, 'table': table, 'columns': columns, 'rows': rows}
+        backend_payload = self._build_backend_payload(
+            final_payload,
+            nAnnotated,
+            minMetaScore if nAnnotated else 0,
+            maxMetaScore if nAnnotated else 1
         )
-        all_scores = [
-            cell.get('annotationMeta', {}).get('lowestScore', float('inf'))
-            for row in final_payload['rows'].values()
-            for cell in row['cells'].values()
-            if cell.get('annotationMeta', {}).get('annotated', False)
-        ]
-        minMetaScore = min(all_scores) if all_scores else 0
-        maxMetaScore = max(all_scores) if all_scores else 1
-    
+        return final_payload, backend_payload
+
+    def create_backend_payload(self, final_payload):
+        # Count the annotated cells and track their score range in a single walk
+        inf = float('inf')
+        nCellsReconciliated = 0
+        lowest = inf
+        highest = -inf
+        for row in final_payload['rows'].values():
+            for cell in row['cells'].values():
+                annotation_meta = cell.get('annotationMeta')
+                if annotation_meta and annotation_meta.get('annotated'):
+                    nCellsReconciliated += 1
+                    score = annotation_meta.get('lowestScore', inf)
+                    if score < lowest:
+                        lowest = score
+                    if score > highest:
+                        highest = score
+        minMetaScore = lowest if nCellsReconciliated else 0
+        maxMetaScore = highest if nCellsReconciliated else 1
+        return self._build_backend_payload(final_payload, nCellsReconciliated, minMetaScore, maxMetaScore)
+
+    def _build_backend_payload(self, final_payload, nCellsReconciliated, minMetaScore, maxMetaScore):
         table_data = final_payload['table']
         columns = final_payload.get('columns', {})
         rows = final_payload.get('rows', {})
@@ -209,28 +304,25 @@ class ReconciliationManager:
             },
             "columns": {
                 "byId": columns,
-                "allIds": list(columns.keys())
+                "allIds": tuple(columns)
             },
             "rows": {
                 "byId": rows,
-                "allIds": list(rows.keys())
+                "allIds": tuple(rows)
             }
         }
     
         return backend_payload
 
     def reconcile(self, table_data, column_name, reconciliator_id, optional_columns):
-        if reconciliator_id not in ['geocodingHere', 'geocodingGeonames', 'geonames']:
+        if reconciliator_id not in _SUPPORTED_RECONCILIATORS:
             raise ValueError("Invalid reconciliator ID. Please use 'geocodingHere', 'geocodingGeonames', or 'geonames'.")
     
         input_data = self.prepare_input_data(table_data, column_name, reconciliator_id, optional_columns)
         response_data = self.send_reconciliation_request(input_data, reconciliator_id)
     
         if response_data:
-            final_payload = self.compose_reconciled_table(table_data, response_data, column_name)
-            final_payload = self.restructure_payload(final_payload)
-            backend_payload = self.create_backend_payload(final_payload)
-            return final_payload, backend_payload
+            return self._apply_reconciliation(table_data, response_data, column_name)
         else:
             return None, None
 
@@ -247,7 +339,7 @@ class ReconciliationManager:
         try:
             url = urljoin(self.api_url, 'reconciliators/list')
             headers = self._get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             response.raise_for_status()
 
             if debug:
@@ -264,7 +356,7 @@ class ReconciliationManager:
                     print(response.text)
                 return None
 
-            return response.json()
+            return orjson.loads(response.content)
         except requests.RequestException as e:
             if debug:
                 print(f"Request error occurred while retrieving reconciliator data: {e}")
@@ -272,13 +364,13 @@ class ReconciliationManager:
                     print(f"Response status code: {e.response.status_code}")
                     print(f"Response content: {e.response.text[:200]}...")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             if debug:
                 print(f"JSON decoding error: {e}")
                 print(f"Raw response content: {response.text}")
             return None
 
-    def get_reconciliators_list(self, debug: bool = False) -> pd.DataFrame:
+    def get_reconciliators_list(self, debug: bool = False) -> "pd.DataFrame":
         """
         Retrieves and cleans the list of reconciliators.
 
@@ -288,6 +380,8 @@ class ReconciliationManager:
         Returns:
             pd.DataFrame: DataFrame containing the cleaned list of reconciliators.
         """
+        import pandas as pd
+
         response = self.get_reconciliator_data(debug=debug)
         if response is not None:
             try:
@@ -308,23 +402,39 @@ class ReconciliationManager:
         Returns:
             pd.DataFrame: Cleaned DataFrame with selected columns.
         """
+        import pandas as pd
+
         if not isinstance(service_list, list):
             print(f"Expected a list, but got {type(service_list)}: {service_list}")
             return pd.DataFrame()
 
+        columns = ["id", "relativeUrl", "name"]
+        get_fields = itemgetter(*columns)
+
         reconciliators = []
         for reconciliator in service_list:
-            if isinstance(reconciliator, dict) and all(key in reconciliator for key in ["id", "relativeUrl", "name"]):
-                reconciliators.append({
-                    "id": reconciliator["id"],
-                    "relativeUrl": reconciliator["relativeUrl"],
-                    "name": reconciliator["name"]
-                })
+            if isinstance(reconciliator, dict) and "id" in reconciliator and "relativeUrl" in reconciliator and "name" in reconciliator:
+                reconciliators.append(get_fields(reconciliator))
             else:
                 print(f"Skipping invalid reconciliator data: {reconciliator}")
         
-        return pd.DataFrame(reconciliators)
+        return pd.DataFrame(reconciliators, columns=columns)
     
+    def _get_reconciliator_index(self, debug: bool = False):
+        """
+        Returns the reconciliators keyed by ID, listing them from the backend only on first use.
+        """
+        if self._reconciliators_by_id is None:
+            reconciliator_data = self.get_reconciliator_data(debug=debug)
+            if not reconciliator_data:
+                return None
+            # First match wins, as with the linear search this replaces
+            index = {}
+            for reconciliator in reconciliator_data:
+                index.setdefault(reconciliator['id'], reconciliator)
+            self._reconciliators_by_id = index
+        return self._reconciliators_by_id
+
     def get_reconciliator_parameters(self, id_reconciliator, debug: bool = False):
         """
         Retrieves the parameters needed for a specific reconciliator service.
@@ -344,54 +454,53 @@ class ReconciliationManager:
         ]
 
         # Get reconciliator data
-        reconciliator_data = self.get_reconciliator_data(debug=debug)
-        if not reconciliator_data:
+        reconciliators = self._get_reconciliator_index(debug=debug)
+        if not reconciliators:
             if debug:
                 print(f"No reconciliator data retrieved for ID '{id_reconciliator}'.")
             return None
 
-        # Iterate over the reconciliators to find the one matching `id_reconciliator`
-        for reconciliator in reconciliator_data:
-            if reconciliator['id'] == id_reconciliator:
-                parameters = reconciliator.get('formParams', [])
+        reconciliator = reconciliators.get(id_reconciliator)
+        if reconciliator is not None:
+            parameters = reconciliator.get('formParams', [])
+            
+            # Create the optional parameters dictionary
+            optional_params = [
+                {
+                    'name': param['id'],
+                    'type': param['inputType'],
+                    'mandatory': 'required' in param.get('rules', []),
+                    'description': param.get('description', ''),
+                    'label': param.get('label', ''),
+                    'infoText': param.get('infoText', '')
+                } for param in parameters
+            ]
+
+            param_dict = {
+                'mandatory': mandatory_params,
+                'optional': optional_params
+            }
+
+            # Handle debug=True: print all details
+            if debug:
+                print(f"Parameters for reconciliator '{id_reconciliator}':")
+                print("\nMandatory parameters:")
+                for param in param_dict['mandatory']:
+                    print(f"- {param['name']} ({param['type']}): Mandatory")
+                    print(f"  Description: {param['description']}")
                 
-                # Create the optional parameters dictionary
-                optional_params = [
-                    {
-                        'name': param['id'],
-                        'type': param['inputType'],
-                        'mandatory': 'required' in param.get('rules', []),
-                        'description': param.get('description', ''),
-                        'label': param.get('label', ''),
-                        'infoText': param.get('infoText', '')
-                    } for param in parameters
-                ]
-
-                param_dict = {
-                    'mandatory': mandatory_params,
-                    'optional': optional_params
-                }
+                print("\nOptional parameters:")
+                for param in param_dict['optional']:
+                    mandatory = "Mandatory" if param['mandatory'] else "Optional"
+                    print(f"- {param['name']} ({param['type']}): {mandatory}")
+                    print(f"  Description: {param['description']}")
+                    print(f"  Label: {param['label']}")
+                    print(f"  Info Text: {param['infoText']}")
+            else:
+                # Format the output nicely if debug=False
+                self._display_formatted_parameters(param_dict, id_reconciliator)
 
-                # Handle debug=True: print all details
-                if debug:
-                    print(f"Parameters for reconciliator '{id_reconciliator}':")
-                    print("\nMandatory parameters:")
-                    for param in param_dict['mandatory']:
-                        print(f"- {param['name']} ({param['type']}): Mandatory")
-                        print(f"  Description: {param['description']}")
-                    
-                    print("\nOptional parameters:")
-                    for param in param_dict['optional']:
-                        mandatory = "Mandatory" if param['mandatory'] else "Optional"
-                        print(f"- {param['name']} ({param['type']}): {mandatory}")
-                        print(f"  Description: {param['description']}")
-                        print(f"  Label: {param['label']}")
-                        print(f"  Info Text: {param['infoText']}")
-                else:
-                    # Format the output nicely if debug=False
-                    self._display_formatted_parameters(param_dict, id_reconciliator)
-
-                return param_dict
+            return param_dict
 
         if debug:
             print(f"No parameters found for reconciliator with ID '{id_reconciliator}'.")
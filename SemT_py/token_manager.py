@@ -1,9 +1,13 @@
 import requests
-import json
+import orjson
 import time
-import jwt
+import threading
+from requests.auth import AuthBase
 
 class TokenManager:
+    # Seconds before the token's expiry at which it is refreshed pre-emptively
+    EXPIRY_MARGIN = 30
+
     def __init__(self, api_url, username, password):
         self.api_url = api_url.rstrip('/')
         self.signin_url = f"{self.api_url}/auth/signin"
@@ -11,13 +15,45 @@ class TokenManager:
         self.password = password
         self.token = None
         self.expiry = 0
+        self._refresh_at = 0
+        # (token, "Bearer <token>"), keyed on the token object so a refresh can never leave a stale header
+        self._auth_header = (None, None)
+        # Serialises sign-ins so threads sharing this manager refresh an expired token only once
+        self._lock = threading.RLock()
+        self._session = requests.Session()
+
+    def _needs_refresh(self):
+        return self.token is None or time.monotonic() >= self._refresh_at
 
     def get_token(self):
-        if self.token is None or time.time() >= self.expiry:
-            self.refresh_token()
+        if self._needs_refresh():
+            with self._lock:
+                # Another thread may have refreshed the token while this one waited
+                if self._needs_refresh():
+                    self.refresh_token()
         return self.token
 
+    @property
+    def auth_header(self):
+        token = self.get_token()
+        cached_token, header = self._auth_header
+        if header is None or cached_token is not token:
+            header = f"Bearer {token}"
+            self._auth_header = (token, header)
+        return header
+
+    def _refresh_if_current(self, auth_header):
+        # Signs in again only if auth_header still carries the current token, i.e. no other
+        # thread has replaced the token since the rejected request was sent
+        with self._lock:
+            if auth_header == self.auth_header:
+                self.refresh_token()
+
     def refresh_token(self):
+        with self._lock:
+            self._sign_in()
+
+    def _sign_in(self):
         signin_data = {"username": self.username, "password": self.password}
         signin_headers = {
             "Accept": "application/json, text/plain, */*",
@@ -25,16 +61,21 @@ class TokenManager:
         }
 
         try:
-            response = requests.post(self.signin_url, headers=signin_headers, data=json.dumps(signin_data))
+            response = self._session.post(self.signin_url, headers=signin_headers, data=orjson.dumps(signin_data))
             response.raise_for_status()
-            token_info = response.json()
+            token_info = orjson.loads(response.content)
             self.token = token_info.get("token")
             
             if self.token:
+                import jwt  # Deferred: only needed once a token has been issued
+
                 decoded = jwt.decode(self.token, options={"verify_signature": False})
                 self.expiry = decoded.get('exp', time.time() + 3600)
             else:
                 self.expiry = time.time() + 3600
+
+            # Translate the wall-clock expiry into a monotonic deadline once per refresh
+            self._refresh_at = time.monotonic() + (self.expiry - time.time()) - self.EXPIRY_MARGIN
                 
         except requests.RequestException as e:
             print(f"Sign-in request failed: {e}")
@@ -43,10 +84,66 @@ class TokenManager:
                 print(f"Response content: {e.response.text}")
             self.token = None
             self.expiry = 0
+            self._refresh_at = 0
+        except orjson.JSONDecodeError as e:
+            # A 2xx reply that is not JSON, e.g. an HTML proxy or maintenance page
+            print(f"Sign-in response could not be decoded: {e}")
+            self.token = None
+            self.expiry = 0
+            self._refresh_at = 0
 
     def get_headers(self):
         return {
             "Accept": "application/json, text/plain, */*",
             "Content-Type": "application/json;charset=UTF-8",
-            "Authorization": f"Bearer {self.get_token()}"
-        }
\ No newline at end of file
+            "Authorization": self.auth_header
+        }
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class BearerAuth(AuthBase):
+    """
+    requests auth hook that attaches the TokenManager's current token to every request.
+    The header string itself is cached on the TokenManager until the token rotates.
+    A 401 answer drops the cached token and the request is re-sent once with a fresh one.
+    """
+
+    def __init__(self, token_manager):
+        self.token_manager = token_manager
+
+    def __call__(self, request):
+        request.headers['Authorization'] = self.token_manager.auth_header
+        request.register_hook('response', self.handle_401)
+        return request
+
+    def handle_401(self, response, **kwargs):
+        request = response.request
+        if response.status_code != 401 or getattr(request, '_bearer_retried', False):
+            return response
+        # Streamed bodies (e.g. multipart uploads) have been consumed and cannot be replayed
+        if request.body is not None and not isinstance(request.body, (bytes, str)):
+            return response
+
+        # Only sign in again if no other request has refreshed the token in the meantime
+        self.token_manager._refresh_if_current(request.headers.get('Authorization'))
+        if self.token_manager.token is None:
+            return response
+
+        # Release the connection before re-sending on the same adapter
+        response.content
+        response.close()
+        retry = request.copy()
+        retry._bearer_retried = True
+        retry.headers['Authorization'] = self.token_manager.auth_header
+        retried = response.connection.send(retry, **kwargs)
+        retried.history.append(response)
+        retried.request = retry
+        return retried
@@ -1,26 +1,146 @@
 import zipfile
 import os
-import inspect
+import gzip
+import io
+import html
+import functools
 import tempfile
-import pandas as pd
 import requests
-import json
+import orjson
+import ijson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
-from typing import Dict, Tuple, List, Optional
-from .token_manager import TokenManager
-from IPython.core.display import HTML
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import FunctionType
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional, Iterator, Iterable
+from .token_manager import TokenManager, BearerAuth
+
+# pandas and IPython are heavy to import and only some helpers need them, so they are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Templates for one metadata entry in display_json_table, formatted in a single call each
+_MISSING = object()
+_META_TPL = "<strong>ID:</strong> {id}<br><strong>Score:</strong> {score}<br><strong>Match:</strong> {match}<br>{types}"
+_META_NAME_TPL = (
+    "<strong>ID:</strong> {id}<br><strong>Name:</strong> {name}<br>"
+    "<strong>Score:</strong> {score}<br><strong>Match:</strong> {match}<br>{types}"
+)
+_META_URI_TPL = (
+    "<strong>ID:</strong> {id}<br><strong>Name:</strong> {name}<br>"
+    "<strong>URI:</strong> <a href='{uri_href}'>{uri}</a><br>"
+    "<strong>Score:</strong> {score}<br><strong>Match:</strong> {match}<br>{types}"
+)
+_META_TYPES_TPL = "<strong>Types:</strong> {}"
+
+# Compression methods accepted by create_zip_file; zipfile gained Zstandard in Python 3.14
+_ZIP_COMPRESSION = {'deflate': zipfile.ZIP_DEFLATED, 'stored': zipfile.ZIP_STORED}
+if hasattr(zipfile, 'ZIP_ZSTANDARD'):
+    _ZIP_COMPRESSION['zstd'] = zipfile.ZIP_ZSTANDARD
+
+def _import_pyarrow():
+    """
+    Returns the pyarrow module with its csv and feather submodules loaded, or None if pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+def _require_pyarrow(feature: str):
+    """
+    Returns the pyarrow module, raising an ImportError that names the feature if it is not installed.
+    """
+    pa = _import_pyarrow()
+    if pa is None:
+        raise ImportError(f"{feature} requires pyarrow. Install it with: pip install SemT_py[arrow]")
+    return pa
+
+@functools.lru_cache(maxsize=None)
+def _class_methods(cls) -> Tuple[str, ...]:
+    """
+    Returns the sorted names of plain and static methods on cls, including inherited ones.
+
+    Walks the class __dict__s directly rather than inspect.getmembers, so no descriptors are triggered.
+    """
+    members = {}
+    for klass in reversed(cls.__mro__):
+        members.update(vars(klass))
+    return tuple(sorted(
+        name for name, value in members.items() if isinstance(value, (FunctionType, staticmethod))
+    ))
+
+def _drop_index(table_data: "pd.DataFrame") -> "pd.DataFrame":
+    # The index is never written, and pandas' MultiIndex to_csv path is many times slower
+    import pandas as pd
+
+    if isinstance(table_data.index, pd.MultiIndex) or table_data.index.name is not None:
+        return table_data.reset_index(drop=True)
+    return table_data
 
 class Utility:
+    # Request bodies larger than this many bytes are sent gzip-compressed
+    GZIP_MIN_BYTES = 4096
+    # Connections kept per host; also the ceiling for the *_many helpers' worker threads
+    POOL_MAXSIZE = 20
+    # Number of parsed W3C tables kept for ETag revalidation
+    W3C_CACHE_SIZE = 8
+
     def __init__(self, api_url: str, token_manager: TokenManager):
         self.api_url = api_url.rstrip('/') + '/'
+        # Endpoint URLs are resolved once; request paths only fill in the ids
+        self._table_url_tpl = urljoin(self.api_url, "api/dataset/{}/table/{}")
+        self._export_url_tpl = urljoin(self.api_url, "/api/dataset/{}/table/{}/export")
         self.token_manager = token_manager
         self.headers = self._get_headers()
 
+        # A single pooled session keeps connections alive across pushes and downloads
+        self._session = requests.Session()
+        # Downloads are retried with backoff on transient gateway errors and dropped reads. Table
+        # saves (PUT) are left out of allowed_methods, so they are only retried when the connection
+        # could not be established: a read timeout or gateway error may mean the server is still
+        # processing the first save, and re-sending it would queue duplicate writes
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self.POOL_MAXSIZE, max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers['Content-Type'] = 'application/json'
+        # Resolve the bearer token per request so refreshed tokens are picked up
+        self._session.auth = BearerAuth(token_manager)
+
+        # (dataset_id, table_id) -> (etag, output_file, DataFrame) for download_json(as_dataframe=True)
+        self._w3c_cache: 'OrderedDict[Tuple[str, str], Tuple[str, str, pd.DataFrame]]' = OrderedDict()
+
     def _get_headers(self) -> Dict[str, str]:
         return {
             'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.token_manager.get_token()}'
+            'Authorization': self.token_manager.auth_header
         }
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'Utility':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     @staticmethod
     def explore_class_methods(cls) -> List[str]:
@@ -28,7 +148,7 @@ class Utility:
         Explore all methods of a class, filtering for user-defined functions only.
         """
         # List all methods defined in the class
-        return [name for name, func in inspect.getmembers(cls, inspect.isfunction)]
+        return list(_class_methods(cls))
 
     @staticmethod
     def explore_submodules(submodules: List) -> Dict[str, Dict[str, List[str]]]:
@@ -54,7 +174,10 @@ class Utility:
             print("-" * 60)
 
             # Get all classes defined in the module
-            classes = [name for name, obj in inspect.getmembers(module, inspect.isclass) if obj.__module__ == module.__name__]
+            classes = sorted(
+                name for name, obj in vars(module).items()
+                if isinstance(obj, type) and obj.__module__ == module.__name__
+            )
             
             module_dict = {}
             for cls_name in classes:
@@ -85,7 +208,13 @@ class Utility:
         """
         def send_request(data: Dict, url: str) -> requests.Response:
             try:
-                response = requests.put(url, json=data, headers=self.headers, timeout=30)
+                body = orjson.dumps(data)
+                headers = None
+                if len(body) > self.GZIP_MIN_BYTES:
+                    # Large W3C-shaped payloads shrink several-fold under gzip
+                    body = gzip.compress(body, compresslevel=6)
+                    headers = {'Content-Encoding': 'gzip'}
+                response = self._session.put(url, data=body, headers=headers, timeout=30)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
@@ -96,10 +225,10 @@ class Utility:
         # Log payload if enabled
         if debug:
             print("Payload being sent:")
-            print(json.dumps(payload, indent=2))
+            print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
     
         # Push to backend
-        backend_url = urljoin(self.api_url, f"api/dataset/{dataset_id}/table/{table_id}")
+        backend_url = self._table_url_tpl.format(dataset_id, table_id)
         response = send_request(payload, backend_url)
     
         # Prepare output
@@ -119,6 +248,15 @@ class Utility:
     
         return success_message, payload
     
+    @staticmethod
+    def _stream_to_file(response: requests.Response, output_file: str, chunk_size: int = 1 << 16) -> None:
+        """
+        Writes a streamed response body to disk chunk by chunk, so the payload is never held in memory.
+        """
+        with open(output_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+
     def download_csv(self, dataset_id: str, table_id: str, output_file: str = "downloaded_data.csv") -> str:
         """
         Downloads a CSV file from the backend and saves it locally.
@@ -129,52 +267,205 @@ class Utility:
         Returns:
             str: The path to the downloaded CSV file.
         """
-        endpoint = f"/api/dataset/{dataset_id}/table/{table_id}/export"
         params = {"format": "csv"}
-        url = urljoin(self.api_url, endpoint)
-
-        response = requests.get(url, params=params, headers=self.headers)
+        url = self._export_url_tpl.format(dataset_id, table_id)
 
-        if response.status_code == 200:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(response.text)
-            print(f"CSV file has been downloaded successfully and saved as {output_file}")
-            return output_file
-        else:
-            raise Exception(f"Failed to download CSV. Status code: {response.status_code}")
+        with self._session.get(url, params=params, stream=True) as response:
+            if response.status_code == 200:
+                self._stream_to_file(response, output_file)
+                print(f"CSV file has been downloaded successfully and saved as {output_file}")
+                return output_file
+            else:
+                raise Exception(f"Failed to download CSV. Status code: {response.status_code}")
 
-    def download_json(self, dataset_id: str, table_id: str, output_file: str = "downloaded_data.json") -> str:
+    def download_json(self, dataset_id: str, table_id: str, output_file: str = "downloaded_data.json",
+                      as_dataframe: bool = False):
         """
         Downloads a JSON file in W3C format from the backend and saves it locally.
 
+        By default the response body is streamed to disk as received. With as_dataframe=True
+        the body is parsed instead, saved in indented form and returned as a DataFrame.
+        Parsed tables are cached by ETag: repeating the call for an unchanged table sends a
+        conditional request and returns a copy of the cached DataFrame on 304 Not Modified.
+
         Args:
             dataset_id (str): The ID of the dataset as a string.
             table_id (str): The ID of the table as a string.
             output_file (str): The name of the file to save the JSON data to. Defaults to "downloaded_data.json".
+            as_dataframe (bool): If True, also parse the data and return it as a DataFrame.
 
         Returns:
-            str: The path to the downloaded JSON file.
+            str or pd.DataFrame: The path to the downloaded JSON file, or the parsed table if as_dataframe is True.
         """
-        endpoint = f"/api/dataset/{dataset_id}/table/{table_id}/export"
         params = {"format": "w3c"}
-        url = urljoin(self.api_url, endpoint)
+        url = self._export_url_tpl.format(dataset_id, table_id)
 
-        response = requests.get(url, params=params, headers=self.headers)
+        # Revalidate a cached parse only if the file it was saved to is still there
+        cache_key = (dataset_id, table_id)
+        cached = self._w3c_cache.get(cache_key) if as_dataframe else None
+        headers = None
+        if cached is not None and cached[1] == output_file and os.path.exists(output_file):
+            headers = {'If-None-Match': cached[0]}
+
+        with self._session.get(url, params=params, headers=headers, stream=not as_dataframe) as response:
+            if response.status_code == 304 and headers is not None:
+                self._w3c_cache.move_to_end(cache_key)
+                print(f"W3C JSON for table {table_id} is unchanged; using the cached copy in {output_file}")
+                return cached[2].copy()
+
+            if response.status_code != 200:
+                raise Exception(f"Failed to download W3C JSON. Status code: {response.status_code}")
+
+            if not as_dataframe:
+                self._stream_to_file(response, output_file)
+                print(f"W3C JSON file has been downloaded successfully and saved as {output_file}")
+                return output_file
 
-        if response.status_code == 200:
             # Parse the JSON data
-            data = response.json()
-            
-            # Save the JSON data to a file
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"W3C JSON file has been downloaded successfully and saved as {output_file}")
-            return output_file
+            data = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+
+        # Save the JSON data to a file
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+        print(f"W3C JSON file has been downloaded successfully and saved as {output_file}")
+        df = self.parse_json(data)
+
+        if etag:
+            self._w3c_cache[cache_key] = (etag, output_file, df.copy())
+            self._w3c_cache.move_to_end(cache_key)
+            while len(self._w3c_cache) > self.W3C_CACHE_SIZE:
+                self._w3c_cache.popitem(last=False)
         else:
-            raise Exception(f"Failed to download W3C JSON. Status code: {response.status_code}")
+            self._w3c_cache.pop(cache_key, None)
+        return df
+
+    def _run_many(self, func, items: Iterable[tuple], max_workers: int) -> List:
+        """
+        Calls func(*item) for every item on a thread pool sharing this session, returning results in input order.
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, self.POOL_MAXSIZE)) as executor:
+            return list(executor.map(lambda item: func(*item), items))
 
-    def parse_json(self, json_data: List[Dict]) -> pd.DataFrame:
+    def push_many(self, items: Iterable[Tuple[str, str, Dict]], max_workers: int = 16) -> List[Tuple[str, Dict]]:
+        """
+        Pushes several payloads to the backend concurrently.
+
+        Args:
+            items (Iterable[Tuple[str, str, Dict]]): (dataset_id, table_id, payload) triples.
+            max_workers (int): Maximum number of concurrent requests, capped at the connection pool size.
+
+        Returns:
+            List[Tuple[str, Dict]]: The push_to_backend result for each item, in input order.
+        """
+        return self._run_many(self.push_to_backend, items, max_workers)
+
+    def download_csv_many(self, items: Iterable[Tuple[str, str, str]], max_workers: int = 16) -> List[str]:
+        """
+        Downloads several tables as CSV concurrently.
+
+        Args:
+            items (Iterable[Tuple[str, str, str]]): (dataset_id, table_id, output_file) triples.
+            max_workers (int): Maximum number of concurrent requests, capped at the connection pool size.
+
+        Returns:
+            List[str]: The path of each downloaded file, in input order. The first failed download raises.
+        """
+        return self._run_many(self.download_csv, items, max_workers)
+
+    def download_json_many(self, items: Iterable[Tuple[str, str, str]], max_workers: int = 16) -> List[str]:
+        """
+        Downloads several tables in W3C JSON format concurrently.
+
+        Args:
+            items (Iterable[Tuple[str, str, str]]): (dataset_id, table_id, output_file) triples.
+            max_workers (int): Maximum number of concurrent requests, capped at the connection pool size.
+
+        Returns:
+            List[str]: The path of each downloaded file, in input order. The first failed download raises.
+        """
+        return self._run_many(self.download_json, items, max_workers)
+
+    def stream_w3c(self, dataset_id: str, table_id: str) -> Iterator[Dict[str, str]]:
+        """
+        Streams a table in W3C format from the backend, yielding one row at a time.
+
+        The response is parsed incrementally with ijson as it arrives, so memory use stays
+        bounded by a single row instead of the whole export.
+
+        Args:
+            dataset_id (str): The ID of the dataset as a string.
+            table_id (str): The ID of the table as a string.
+
+        Yields:
+            Dict[str, str]: A mapping of column label to cell label for each row.
+        """
+        rows = self._iter_w3c(dataset_id, table_id)
+        labels = next(rows, None)
+        if labels is None:
+            return
+        for row in rows:
+            yield dict(zip(labels, row))
+
+    def stream_w3c_dataframe(self, dataset_id: str, table_id: str) -> "pd.DataFrame":
+        """
+        Downloads a table in W3C format straight into a DataFrame, parsing the response incrementally.
+
+        Unlike download_json(as_dataframe=True) the full JSON document is never materialised, so
+        peak memory is the DataFrame's row lists plus a single row being parsed.
+
+        Args:
+            dataset_id (str): The ID of the dataset as a string.
+            table_id (str): The ID of the table as a string.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the table's cell labels.
+        """
+        import pandas as pd
+
+        rows = self._iter_w3c(dataset_id, table_id)
+        labels = next(rows, None)
+        if labels is None:
+            return pd.DataFrame()
+        return pd.DataFrame(list(rows), columns=labels)
+
+    def _iter_w3c(self, dataset_id: str, table_id: str) -> Iterator[List]:
+        """
+        Streams a W3C export through ijson, yielding the column labels first and then each row's cell labels.
+        """
+        params = {"format": "w3c"}
+        url = self._export_url_tpl.format(dataset_id, table_id)
+
+        with self._session.get(url, params=params, stream=True) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to download W3C JSON. Status code: {response.status_code}")
+
+            # Let urllib3 undo any gzip transfer encoding before ijson sees the bytes
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, 'item', use_float=True)
+
+            # The first item holds the column headers
+            header = next(items, None)
+            if header is None:
+                return
+            th_keys = [key for key in header if key.startswith('th')]
+            labels = [header[key]['label'] for key in th_keys]
+            yield labels
+
+            first = next(items, None)
+            if first is None:
+                return
+            # Rows are keyed either by column label or by the header's th* key
+            keys = labels if labels and labels[0] in first else th_keys
+
+            yield [first[key]['label'] for key in keys]
+            for item in items:
+                yield [item[key]['label'] for key in keys]
+
+    def parse_json(self, json_data: List[Dict]) -> "pd.DataFrame":
         """
         Parses the W3C JSON format into a pandas DataFrame.
 
@@ -184,24 +475,38 @@ class Utility:
         Returns:
             pd.DataFrame: A DataFrame containing the parsed data.
         """
+        import pandas as pd
+
         # Extract column names from the first item (metadata)
-        columns = [key for key in json_data[0].keys() if key.startswith('th')]
-        column_names = [json_data[0][col]['label'] for col in columns]
+        th_keys = [key for key in json_data[0] if key.startswith('th')]
+        column_names = [json_data[0][key]['label'] for key in th_keys]
+
+        # Rows are keyed either by column label or by the header's th* key
+        rows = json_data[1:]
+        if rows and column_names and column_names[0] in rows[0]:
+            keys = column_names
+        else:
+            keys = th_keys
 
-        # Extract data rows
-        data_rows = []
-        for item in json_data[1:]:  # Skip the first item (metadata)
-            row = [item[col]['label'] for col in column_names]
-            data_rows.append(row)
+        # Extract data rows in one pass, skipping the first item (metadata); itemgetter
+        # pulls every cell of a row in one C-level call (it only returns a tuple for 2+ keys)
+        if len(keys) > 1:
+            pluck = itemgetter(*keys)
+        else:
+            pluck = lambda item: tuple(item[key] for key in keys)
+        label_of = itemgetter('label')
+        data_rows = [list(map(label_of, pluck(item))) for item in rows]
 
         # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=column_names)
-        return df
+        return pd.DataFrame(data_rows, columns=column_names)
     
     @staticmethod
-    def create_temp_csv(table_data: pd.DataFrame) -> str:
+    def create_temp_csv(table_data: "pd.DataFrame") -> str:
         """
         Creates a temporary CSV file from a DataFrame.
+
+        The CSV is always written by pandas, so the text the backend receives does not depend on
+        which optional dependencies are installed.
         
         Args:
             table_data (DataFrame): The table data to be written to the CSV file.
@@ -209,13 +514,126 @@ class Utility:
         Returns:
             str: The path of the temporary CSV file.
         """
+        table_data = _drop_index(table_data)
+
         with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.csv') as temp_file:
-            table_data.to_csv(temp_file, index=False)
             temp_file_path = temp_file.name
+            table_data.to_csv(temp_file, index=False, chunksize=100_000)
         
         return temp_file_path
+
+    @staticmethod
+    def create_csv_buffer(table_data: "pd.DataFrame") -> io.BytesIO:
+        """
+        Serialises a DataFrame to UTF-8 CSV in memory, ready to be uploaded without a temporary file.
+
+        Like create_temp_csv, the CSV is always written by pandas, so the uploaded text is the same
+        whether or not optional dependencies are installed.
+
+        Args:
+            table_data (DataFrame): The table data to be serialised.
+
+        Returns:
+            io.BytesIO: A buffer positioned at the start of the CSV bytes.
+        """
+        table_data = _drop_index(table_data)
+
+        # pandas encodes straight into the buffer, so the CSV bytes exist only once in memory
+        buffer = io.BytesIO()
+        table_data.to_csv(buffer, index=False, encoding='utf-8')
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def create_temp_arrow(table_data: "pd.DataFrame") -> str:
+        """
+        Creates a temporary Arrow IPC (Feather) file from a DataFrame.
+
+        Column types are kept and no per-cell string formatting is done, so this is much faster
+        than CSV for large tables. Requires the optional pyarrow dependency.
+
+        Args:
+            table_data (DataFrame): The table data to be written to the file.
+
+        Returns:
+            str: The path of the temporary Feather file.
+        """
+        pa = _require_pyarrow("create_temp_arrow")
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.feather') as temp_file:
+            temp_file_path = temp_file.name
+
+        table = pa.Table.from_pandas(table_data, preserve_index=False)
+        pa.feather.write_feather(table, temp_file_path, compression='lz4')
+        return temp_file_path
     
-    def create_zip_file(self, df: pd.DataFrame, zip_filename: Optional[str] = None) -> str:
+    @staticmethod
+    def create_temp_parquet(table_data: "pd.DataFrame") -> str:
+        """
+        Creates a temporary zstd-compressed Parquet file from a DataFrame.
+
+        Parquet is columnar and typed, so it is typically several times smaller than the equivalent
+        CSV and faster to read back. Requires the optional pyarrow dependency.
+
+        Args:
+            table_data (DataFrame): The table data to be written to the file.
+
+        Returns:
+            str: The path of the temporary Parquet file.
+        """
+        _require_pyarrow("create_temp_parquet")
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.parquet') as temp_file:
+            temp_file_path = temp_file.name
+
+        table_data.to_parquet(temp_file_path, engine='pyarrow', compression='zstd', compression_level=3, index=False)
+        return temp_file_path
+
+    @staticmethod
+    def convert_csv_to_parquet(csv_path: str, parquet_path: Optional[str] = None) -> str:
+        """
+        Converts a CSV file to zstd-compressed Parquet with pyarrow's multithreaded CSV reader,
+        without going through pandas.
+
+        Args:
+            csv_path (str): The path of the CSV file to convert.
+            parquet_path (str, optional): Where to write the Parquet file. Defaults to csv_path with a .parquet suffix.
+
+        Returns:
+            str: The path of the Parquet file.
+        """
+        pa = _require_pyarrow("convert_csv_to_parquet")
+
+        if parquet_path is None:
+            parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+
+        table = pa.csv.read_csv(csv_path)
+        pa.parquet.write_table(table, parquet_path, compression='zstd', compression_level=3)
+        return parquet_path
+
+    def download_parquet(self, dataset_id: str, table_id: str, output_file: str = "downloaded_data.parquet") -> str:
+        """
+        Downloads a table from the backend and saves it locally as Parquet.
+
+        The backend only exports CSV and W3C JSON, so the CSV export is streamed to a temporary
+        file and converted with convert_csv_to_parquet. Requires the optional pyarrow dependency.
+
+        Args:
+            dataset_id (str): The ID of the dataset as a string.
+            table_id (str): The ID of the table as a string.
+            output_file (str): The name of the Parquet file to create. Defaults to "downloaded_data.parquet".
+
+        Returns:
+            str: The path to the Parquet file.
+        """
+        _require_pyarrow("download_parquet")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = self.download_csv(dataset_id, table_id, os.path.join(temp_dir, 'data.csv'))
+            return self.convert_csv_to_parquet(csv_path, output_file)
+
+    def create_zip_file(self, df: "pd.DataFrame", zip_filename: Optional[str] = None,
+                        compression: str = 'deflate', compresslevel: Optional[int] = None) -> str:
         """
         Creates a zip file containing a CSV file from the given DataFrame.
         The zip file is created as a temporary file unless a filename is specified.
@@ -223,31 +641,90 @@ class Utility:
         Args:
             df (pandas.DataFrame): The DataFrame to be saved as a CSV file.
             zip_filename (str, optional): The path to the zip file to be created.
+            compression (str): Compression method for the CSV entry: 'deflate' (default), 'stored',
+                or 'zstd' (requires Python 3.14+). Zstandard compresses CSV text several times faster
+                than deflate at a similar ratio, but readers must support it too.
+            compresslevel (int, optional): Compression level passed to zipfile; lower is faster.
 
         Returns:
             str: The path to the created zip file.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save the DataFrame to a CSV file in the temporary directory
-            csv_file = os.path.join(temp_dir, 'data.csv')
-            df.to_csv(csv_file, index=False)
+        if compression not in _ZIP_COMPRESSION:
+            raise ValueError(
+                f"Unsupported compression '{compression}'. Choose from: {', '.join(_ZIP_COMPRESSION)}"
+            )
+
+        # Determine the path for the zip file
+        if zip_filename:
+            zip_path = zip_filename
+        else:
+            # Create a temporary file for the zip
+            temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
+            temp_zip.close()
+            zip_path = temp_zip.name
+
+        # Write the CSV straight into the zip entry, without a temporary CSV on disk
+        with zipfile.ZipFile(zip_path, 'w', _ZIP_COMPRESSION[compression], compresslevel=compresslevel) as z:
+            with io.TextIOWrapper(z.open('data.csv', 'w'), encoding='utf-8', newline='') as csv_file:
+                df.to_csv(csv_file, index=False)
+
+        # Return the path to the zip file
+        return zip_path
+    
+    @staticmethod
+    def _build_html(columns: List[Tuple[str, List, bool]], n_rows: int) -> str:
+        """
+        Renders (header, values, escape) columns as an HTML table in a single pass, without building a DataFrame.
+        """
+        buf = io.StringIO()
+        write = buf.write
+        write('<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n')
+        write(''.join([f'      <th>{html.escape(str(header))}</th>\n' for header, _, _ in columns]))
+        write('    </tr>\n  </thead>\n  <tbody>\n')
+
+        # Wrap each column's cells in <td> once, then assemble every row with a single join
+        cells = [
+            [f'      <td>{html.escape(str(value)) if escape else value}</td>\n' for value in values]
+            for _, values, escape in columns
+        ]
+        for row in (zip(*cells) if cells else [()] * n_rows):
+            write(f"    <tr>\n{''.join(row)}    </tr>\n")
+        write('  </tbody>\n</table>')
+        return buf.getvalue()
 
-            # Determine the path for the zip file
-            if zip_filename:
-                zip_path = zip_filename
+    @staticmethod
+    def _format_metadata(cell_metadata: List[Dict]) -> str:
+        """
+        Formats a cell's metadata entries as an HTML fragment for display_json_table.
+        """
+        # Structuring metadata as a formatted string for display using HTML
+        formatted_metadata = []
+        for meta in cell_metadata:
+            meta_type = meta.get('type')
+            types = (
+                _META_TYPES_TPL.format(', '.join(t.get('name', 'N/A') for t in meta_type))
+                if isinstance(meta_type, list) else ''
+            )
+            name = meta.get('name', _MISSING)
+            uri = uri_href = None
+            if name is _MISSING:
+                template = _META_TPL
+            elif isinstance(name, dict):
+                template = _META_URI_TPL
+                uri_href, uri = name.get('uri', '#'), name.get('uri', 'N/A')
+                name = name.get('value', 'N/A')
             else:
-                # Create a temporary file for the zip
-                temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-                temp_zip.close()
-                zip_path = temp_zip.name
+                template = _META_NAME_TPL
 
-            # Create a zip file containing the CSV
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as z:
-                z.write(csv_file, os.path.basename(csv_file))
+            formatted_metadata.append(template.format(
+                id=meta.get('id', 'N/A'), name=name,
+                uri_href=uri_href, uri=uri,
+                score=meta.get('score', 'N/A'), match=meta.get('match', 'N/A'), types=types
+            ))
+
+        # Combine all metadata entries into one string with double line breaks between them
+        return "<br><br>".join(formatted_metadata)
 
-            # Return the path to the zip file
-            return zip_path
-    
     @staticmethod
     def display_json_table(json_table, number_of_rows=None, from_row=0, labels=None):
         # Set default number_of_rows if not provided
@@ -258,72 +735,37 @@ class Utility:
         if labels is None:
             labels = list(json_table['columns'].keys())
 
-        # Extracting rows and creating a DataFrame
-        data = []
-        columns_with_metadata = set()  # To keep track of columns that have metadata
-
-        for i in range(from_row, from_row + number_of_rows):
-            row_key = f'r{i}'
-            if row_key not in json_table['rows']:
-                continue
-
-            row_value = json_table['rows'][row_key]
-            row_data = {}
-            
-            # Iterate over the selected labels (columns)
-            for label in labels:
-                cell_data = row_value['cells'].get(label, {})
-                cell_label = cell_data.get('label', 'N/A')
-                cell_metadata = cell_data.get('metadata', [])
-
-                row_data[label] = cell_label
-
-                if cell_metadata:
-                    columns_with_metadata.add(label)
-                    # Structuring metadata as a formatted string for display using HTML
-                    formatted_metadata = []
-                    for meta in cell_metadata:
-                        metadata_lines = [
-                            f"<strong>ID:</strong> {meta.get('id', 'N/A')}<br>"
-                        ]
-                        if 'name' in meta:
-                            if isinstance(meta['name'], dict):
-                                metadata_lines.extend([
-                                    f"<strong>Name:</strong> {meta['name'].get('value', 'N/A')}<br>",
-                                    f"<strong>URI:</strong> <a href='{meta['name'].get('uri', '#')}'>{meta['name'].get('uri', 'N/A')}</a><br>"
-                                ])
-                            else:
-                                metadata_lines.append(f"<strong>Name:</strong> {meta['name']}<br>")
-                        
-                        metadata_lines.extend([
-                            f"<strong>Score:</strong> {meta.get('score', 'N/A')}<br>",
-                            f"<strong>Match:</strong> {meta.get('match', 'N/A')}<br>"
-                        ])
-                        
-                        if 'type' in meta and isinstance(meta['type'], list):
-                            types = ', '.join(t.get('name', 'N/A') for t in meta['type'])
-                            metadata_lines.append(f"<strong>Types:</strong> {types}")
-                        
-                        formatted_metadata.append("".join(metadata_lines))
-
-                    # Combine all metadata entries into one string with double line breaks between them
-                    formatted_metadata_str = "<br><br>".join(formatted_metadata)
-                    row_data[f'{label}_metadata'] = formatted_metadata_str
-
-            data.append(row_data)
-
-        # Creating DataFrame
-        df = pd.DataFrame(data)
-
-        # Remove metadata columns for labels that don't have metadata
-        columns_to_keep = labels + [f'{label}_metadata' for label in columns_with_metadata]
-        df = df[columns_to_keep]
-
-        # Displaying the DataFrame as a table with structured metadata using HTML rendering
-        pd.set_option('display.max_colwidth', None)  # Allow full display of cell contents
+        # Collect the selected rows once, then build each column in its own pass
+        rows = json_table['rows']
+        row_cells = [
+            rows[row_key]['cells']
+            for row_key in (f'r{i}' for i in range(from_row, from_row + number_of_rows))
+            if row_key in rows
+        ]
+        n_rows = len(row_cells)
+
+        columns = {}
+        metadata_columns = {}  # Only labels that actually carry metadata get a column
+        for label in labels:
+            column_cells = [cells.get(label, {}) for cells in row_cells]
+            columns[label] = [cell.get('label', 'N/A') for cell in column_cells]
+
+            # Columns without any metadata skip the formatter entirely
+            column_metadata = [cell.get('metadata') for cell in column_cells]
+            if any(column_metadata):
+                metadata_columns[label] = [
+                    Utility._format_metadata(cell_metadata) if cell_metadata else ''
+                    for cell_metadata in column_metadata
+                ]
+
+        # Cell labels are escaped, metadata columns are already HTML; keep metadata only for labels that have it
+        html_columns = [(label, columns[label], True) for label in columns]
+        html_columns.extend(
+            (f'{label}_metadata', metadata_columns[label], False) for label in labels if label in metadata_columns
+        )
+        html_output = Utility._build_html(html_columns, n_rows)
 
         # Define CSS styles for better formatting
-        html_output = df.to_html(escape=False, index=False)
         styled_output = f"""
         <style>
             table {{
@@ -345,4 +787,6 @@ class Utility:
         """
 
         # Render the styled HTML output
+        from IPython.core.display import HTML
+
         return HTML(styled_output)
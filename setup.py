@@ -11,8 +11,14 @@ setup(
         'PyJWT',
         'fake-useragent',
         'requests',
+        'requests-toolbelt',
+        'orjson',
+        'ijson',
         'python-dateutil',  # Add other dependencies as needed
     ],
+    extras_require={
+        'arrow': ['pyarrow>=12'],
+    },
     author='Alidu Abubakari',
     author_email='a.abubakari@campus.unimib.it',
     description='A utility package for Semantic Enrichment of Tables',